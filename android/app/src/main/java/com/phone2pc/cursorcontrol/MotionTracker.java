@@ -17,6 +17,8 @@ import org.opencv.core.Size;
 import org.opencv.imgproc.Imgproc;
 import org.opencv.video.Video;
 
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
 import java.util.concurrent.Executors;
 import java.util.concurrent.ScheduledExecutorService;
 import java.util.concurrent.TimeUnit;
@@ -225,9 +227,13 @@ public class MotionTracker {
     private void sendMotionData(double dx, double dy) {
         if (udpSender != null && udpSender.isRunning()) {
             try {
-                // Create motion data packet
-                String motionData = String.format("MOTION:%.2f,%.2f", dx, dy);
-                udpSender.sendData(motionData.getBytes());
+                // Binary motion frame: 'M' + little-endian float dx, dy (9 bytes).
+                // Avoids String.format and UTF-8 parsing on both ends.
+                ByteBuffer frame = ByteBuffer.allocate(9).order(ByteOrder.LITTLE_ENDIAN);
+                frame.put((byte) 'M');
+                frame.putFloat((float) dx);
+                frame.putFloat((float) dy);
+                udpSender.sendData(frame.array());
             } catch (Exception e) {
                 Log.e(TAG, "Error sending motion data", e);
             }
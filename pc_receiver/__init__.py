@@ -0,0 +1 @@
+"""PC-side receiver package for Phone2PC cursor control"""
@@ -0,0 +1,171 @@
+"""
+Cursor-positioning backends for the Phone2PC receiver.
+
+Binds the fastest OS primitive available through ctypes: user32 on
+Windows, libX11 on Linux, CoreGraphics on macOS. pyautogui (which drags
+in PIL, mouseinfo and pyscreeze for ~300ms of import time and ~30MB of
+RSS) is only imported lazily if none of the direct backends load.
+"""
+
+import ctypes
+import logging
+import sys
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _POINT(ctypes.Structure):
+    """Win32 POINT struct for GetCursorPos"""
+    _fields_ = [('x', ctypes.c_long), ('y', ctypes.c_long)]
+
+
+class _CGPoint(ctypes.Structure):
+    """CoreGraphics CGPoint struct"""
+    _fields_ = [('x', ctypes.c_double), ('y', ctypes.c_double)]
+
+
+class CursorBackend:
+    """Facade over the platform cursor primitive: get_pos/set_pos/screen_size"""
+
+    def __init__(self):
+        self._user32 = None
+        self._x11 = None
+        self._x11_display = None
+        self._cg = None
+        self._pa = None
+        self._point = _POINT()
+
+        if sys.platform.startswith('win'):
+            self._init_win32()
+        elif sys.platform == 'darwin':
+            self._init_quartz()
+        elif sys.platform.startswith('linux'):
+            self._init_x11()
+
+        if (self._user32 is None and self._x11 is None
+                and self._cg is None):
+            logger.info("No direct cursor backend available, using pyautogui")
+
+    # -- platform setup ---------------------------------------------------
+
+    def _init_win32(self):
+        self._user32 = ctypes.windll.user32
+
+    def _init_x11(self):
+        try:
+            x11 = ctypes.CDLL('libX11.so.6')
+        except OSError:
+            return
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XWarpPointer.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong,
+            ctypes.c_int, ctypes.c_int, ctypes.c_uint, ctypes.c_uint,
+            ctypes.c_int, ctypes.c_int]
+        x11.XQueryPointer.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong,
+            ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_uint)]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+
+        display = x11.XOpenDisplay(None)
+        if not display:
+            return
+        self._x11 = x11
+        self._x11_display = display
+        self._x11_screen = x11.XDefaultScreen(display)
+        self._x11_root = x11.XDefaultRootWindow(display)
+        # Out-params allocated once, reused on every query
+        self._x11_query = (
+            ctypes.c_ulong(), ctypes.c_ulong(),
+            ctypes.c_int(), ctypes.c_int(),
+            ctypes.c_int(), ctypes.c_int(), ctypes.c_uint())
+
+    def _init_quartz(self):
+        try:
+            cg = ctypes.CDLL('/System/Library/Frameworks/CoreGraphics'
+                             '.framework/CoreGraphics')
+            cf = ctypes.CDLL('/System/Library/Frameworks/CoreFoundation'
+                             '.framework/CoreFoundation')
+        except OSError:
+            return
+        cg.CGMainDisplayID.restype = ctypes.c_uint32
+        cg.CGDisplayPixelsWide.argtypes = [ctypes.c_uint32]
+        cg.CGDisplayPixelsWide.restype = ctypes.c_size_t
+        cg.CGDisplayPixelsHigh.argtypes = [ctypes.c_uint32]
+        cg.CGDisplayPixelsHigh.restype = ctypes.c_size_t
+        cg.CGEventCreate.argtypes = [ctypes.c_void_p]
+        cg.CGEventCreate.restype = ctypes.c_void_p
+        cg.CGEventGetLocation.argtypes = [ctypes.c_void_p]
+        cg.CGEventGetLocation.restype = _CGPoint
+        cg.CGWarpMouseCursorPosition.argtypes = [_CGPoint]
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        self._cg = cg
+        self._cf = cf
+
+    def _pyautogui(self):
+        """Import pyautogui on first use only"""
+        if self._pa is None:
+            import pyautogui
+            pyautogui.FAILSAFE = False
+            self._pa = pyautogui
+        return self._pa
+
+    # -- primitives -------------------------------------------------------
+
+    def screen_size(self) -> Tuple[int, int]:
+        """Return the primary screen size in pixels"""
+        if self._user32 is not None:
+            return (self._user32.GetSystemMetrics(0),
+                    self._user32.GetSystemMetrics(1))
+        if self._x11 is not None:
+            return (self._x11.XDisplayWidth(self._x11_display,
+                                            self._x11_screen),
+                    self._x11.XDisplayHeight(self._x11_display,
+                                             self._x11_screen))
+        if self._cg is not None:
+            display = self._cg.CGMainDisplayID()
+            return (self._cg.CGDisplayPixelsWide(display),
+                    self._cg.CGDisplayPixelsHigh(display))
+        return self._pyautogui().size()
+
+    def get_pos(self) -> Tuple[int, int]:
+        """Read the current cursor position"""
+        if self._user32 is not None:
+            pt = self._point
+            self._user32.GetCursorPos(ctypes.byref(pt))
+            return pt.x, pt.y
+        if self._x11 is not None:
+            root, child, rx, ry, wx, wy, mask = self._x11_query
+            self._x11.XQueryPointer(self._x11_display, self._x11_root,
+                                    ctypes.byref(root), ctypes.byref(child),
+                                    ctypes.byref(rx), ctypes.byref(ry),
+                                    ctypes.byref(wx), ctypes.byref(wy),
+                                    ctypes.byref(mask))
+            return rx.value, ry.value
+        if self._cg is not None:
+            event = self._cg.CGEventCreate(None)
+            loc = self._cg.CGEventGetLocation(event)
+            self._cf.CFRelease(event)
+            return int(loc.x), int(loc.y)
+        return self._pyautogui().position()
+
+    def set_pos(self, x: int, y: int):
+        """Warp the cursor to an absolute position"""
+        if self._user32 is not None:
+            self._user32.SetCursorPos(x, y)
+        elif self._x11 is not None:
+            self._x11.XWarpPointer(self._x11_display, 0, self._x11_root,
+                                   0, 0, 0, 0, x, y)
+            self._x11.XFlush(self._x11_display)
+        elif self._cg is not None:
+            self._cg.CGWarpMouseCursorPosition(_CGPoint(x, y))
+        else:
+            self._pyautogui().moveTo(x, y, duration=0)
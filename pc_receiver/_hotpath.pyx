@@ -0,0 +1,32 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled hot path for per-packet motion handling.
+
+Mirrors the pure-Python _motion_step kernel in cursor_controller; when this
+module is built (setup.py cythonizes it if Cython is installed) the EMA
+update runs as a handful of machine instructions instead of interpreted
+bytecode with dict lookups. The smoothing state is a typed view on the
+controller's _state array, so the scalar and batched paths always agree.
+"""
+
+
+cdef class HotPath:
+    """Typed coefficients and kernel for the motion fast path"""
+
+    cdef double[::1] state
+    cdef public double sensitivity
+    cdef public double smoothing_factor
+
+    def __cinit__(self, double[::1] state, double sensitivity=1.0,
+                  double smoothing_factor=0.7):
+        self.state = state
+        self.sensitivity = sensitivity
+        self.smoothing_factor = smoothing_factor
+
+    cpdef (double, double) step(self, double dx, double dy):
+        """Sensitivity multiply plus EMA update; returns smoothed deltas"""
+        cdef double beta = self.smoothing_factor
+        cdef double gain = (1.0 - beta) * self.sensitivity
+        self.state[0] = beta * self.state[0] + gain * dx
+        self.state[1] = beta * self.state[1] + gain * dy
+        return self.state[0], self.state[1]
@@ -4,14 +4,20 @@ Phone2PC Cursor Controller
 Receives motion data from Android phone via UDP and controls PC mouse cursor
 """
 
+import asyncio
+import collections
+import ctypes
+import errno
+import os
 import socket
+import struct
+import sys
 import threading
 import time
 import json
 import logging
 from typing import Tuple, Optional
-import pyautogui
-import psutil
+import numpy as np
 
 # Configure logging
 logging.basicConfig(
@@ -20,196 +26,738 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Batched UDP receive via Linux recvmmsg(2): drains up to RECV_BATCH datagrams
+# per syscall instead of one recvfrom() per packet. On macOS/Windows we fall
+# back to the plain recvfrom() path.
+RECV_BATCH = 64
+RECV_BUF_SIZE = 256
+MSG_WAITFORONE = 0x10000
+
+# Socket tuning: a big receive buffer absorbs Wi-Fi bursts without drops,
+# busy-polling keeps the kernel spinning briefly instead of sleeping between
+# packets. Linux-only constants are not all exposed by the socket module.
+SOCKET_RCVBUF = 4 * 1024 * 1024
+SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+SO_PRIORITY = getattr(socket, 'SO_PRIORITY', 12)
+SO_INCOMING_CPU = getattr(socket, 'SO_INCOMING_CPU', 49)
+IP_RECVERR = getattr(socket, 'IP_RECVERR', 11)
+BUSY_POLL_USEC = 50
+
+# Seconds between status log lines
+STATUS_INTERVAL = 5.0
+
+# Malformed-packet log lines allowed per status interval; a glitchy or
+# hostile client must not turn the hot path into a logging loop
+BAD_PACKET_LOG_BUDGET = 10
+
+# Frames queued between the socket readers and the processing worker.
+# On overflow the oldest entries fall off: motion is a derivative, so
+# the newest samples are the ones that matter.
+FRAME_QUEUE_DEPTH = 256
+
+if sys.platform.startswith('linux'):
+    class _iovec(ctypes.Structure):
+        _fields_ = [('iov_base', ctypes.c_void_p),
+                    ('iov_len', ctypes.c_size_t)]
+
+    class _msghdr(ctypes.Structure):
+        _fields_ = [('msg_name', ctypes.c_void_p),
+                    ('msg_namelen', ctypes.c_uint),
+                    ('msg_iov', ctypes.POINTER(_iovec)),
+                    ('msg_iovlen', ctypes.c_size_t),
+                    ('msg_control', ctypes.c_void_p),
+                    ('msg_controllen', ctypes.c_size_t),
+                    ('msg_flags', ctypes.c_int)]
+
+    class _mmsghdr(ctypes.Structure):
+        _fields_ = [('msg_hdr', _msghdr),
+                    ('msg_len', ctypes.c_uint)]
+
+    try:
+        _libc = ctypes.CDLL('libc.so.6', use_errno=True)
+        _recvmmsg = _libc.recvmmsg
+        _recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_mmsghdr),
+                              ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+        _recvmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _recvmmsg = None
+else:
+    _recvmmsg = None
+
+
+# Binary motion frame: b'M' + little-endian float dx, dy (9 bytes total).
+# Replaces the old "MOTION:dx,dy" text format, which cost a UTF-8 decode,
+# two splits and two float() parses per packet.
+MOTION_STRUCT = struct.Struct('<ff')
+MOTION_FRAME_LEN = 1 + MOTION_STRUCT.size
+MOTION_MARKER = ord('M')
+
+
+class _RxBuffers:
+    """Per-listener recvmmsg buffer set; never shared between threads"""
+    __slots__ = ('bufs', 'names', 'iovecs', 'msgs', 'pairs')
+
+    def __init__(self):
+        self.bufs = [ctypes.create_string_buffer(RECV_BUF_SIZE)
+                     for _ in range(RECV_BATCH)]
+        self.names = [ctypes.create_string_buffer(128)
+                      for _ in range(RECV_BATCH)]
+        self.iovecs = (_iovec * RECV_BATCH)()
+        self.msgs = (_mmsghdr * RECV_BATCH)()
+        for i in range(RECV_BATCH):
+            self.iovecs[i].iov_base = ctypes.cast(self.bufs[i],
+                                                  ctypes.c_void_p)
+            self.iovecs[i].iov_len = RECV_BUF_SIZE
+            hdr = self.msgs[i].msg_hdr
+            hdr.msg_name = ctypes.cast(self.names[i], ctypes.c_void_p)
+            hdr.msg_namelen = 128
+            hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            hdr.msg_iovlen = 1
+        # Scratch array for one batch of motion deltas
+        self.pairs = np.empty((RECV_BATCH, 2), dtype=np.float64)
+
+
+# Cursor moves are flushed at most this often; phones send at 100-400Hz but
+# no display shows more than ~144 positions per second, so the extra
+# WM_MOUSEMOVE/X warp dispatches would never be visible anyway
+MOVE_INTERVAL = 1.0 / 144.0
+
+
+def _motion_step(dx: float, dy: float, state, sens: float,
+                 beta: float) -> Tuple[float, float]:
+    """Fused per-packet kernel: sensitivity multiply and EMA update.
+
+    Updates the smoothed dx/dy held in `state` in place and returns the
+    new smoothed deltas. Kept free of attribute access so Numba can
+    compile it to a single machine-code routine.
+    """
+    state[0] = beta * state[0] + (1.0 - beta) * (dx * sens)
+    state[1] = beta * state[1] + (1.0 - beta) * (dy * sens)
+    return state[0], state[1]
+
+
+# Numba is optional: when present the kernel is JIT-compiled (warmed up in
+# start()); otherwise the pure-Python version above runs unchanged.
+try:
+    from numba import njit
+    _motion_step = njit(cache=True)(_motion_step)
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# SciPy is optional: when present, batched smoothing runs the exact IIR
+# recurrence in C via lfilter instead of the geometric-weight dot product.
+try:
+    from scipy.signal import lfilter
+    HAVE_SCIPY = True
+except ImportError:
+    HAVE_SCIPY = False
+
+# The compiled Cython hot path is optional too (built by setup.py when
+# Cython is available); the second import form covers running this file
+# directly as a script from pc_receiver/.
+try:
+    from pc_receiver._hotpath import HotPath
+except ImportError:
+    try:
+        from _hotpath import HotPath
+    except ImportError:
+        HotPath = None
+
+# Cursor backend (ctypes Win32/X11/Quartz with lazy pyautogui fallback);
+# the second form covers running this file directly as a script.
+try:
+    from pc_receiver._backend import CursorBackend
+except ImportError:
+    from _backend import CursorBackend
+
 class CursorController:
-    def __init__(self, host: str = '0.0.0.0', port: int = 5000):
+    def __init__(self, host: str = '0.0.0.0', port: int = 5000,
+                 listeners: int = 1, cpu_affinity: Optional[int] = None):
         self.host = host
         self.port = port
+        # When set, the receive loop is pinned to this core (and the
+        # kernel is asked to steer packet processing there too) so the
+        # softirq, the copy to userspace and the handler share caches
+        self.cpu_affinity = cpu_affinity
         self.socket = None
+        self.sockets = []
+        self.listeners = max(1, listeners)
         self.is_running = False
         self.connected_clients = set()
+        self._stop_event = None
+        # Nearly every packet repeats the previous source, so remember it
+        # and skip the set hash/insert on the fast path
+        self._last_client_ip = None
+
+        # Token bucket for malformed-packet warnings, refilled each tick
+        self._bad_pkt_budget = BAD_PACKET_LOG_BUDGET
+
+        # Serializes updates to the shared smoothing state
+        self._motion_lock = threading.Lock()
+
+        # Producer/consumer handoff: readers only enqueue frames here so
+        # kernel drains are never stalled behind cursor-move dispatch
+        self._q = collections.deque(maxlen=FRAME_QUEUE_DEPTH)
+        self._q_ev = threading.Event()
         
-        # Cursor control parameters
+        # Cursor control parameters; _state holds smoothed dx/dy for the
+        # fused motion kernel
         self.sensitivity = 1.0
         self.smoothing_factor = 0.7
-        self.smoothed_dx = 0.0
-        self.smoothed_dy = 0.0
+        self._state = np.zeros(2, dtype=np.float64)
+
+        # Compiled per-packet kernel when the Cython extension is built;
+        # it works on a view of _state so both kernels share one state
+        self._hotpath = (HotPath(self._state, self.sensitivity,
+                                 self.smoothing_factor)
+                         if HotPath is not None else None)
+
+        # Pure-Python fallback kernel, specialized for the current
+        # coefficients (regenerated by set_sensitivity/set_smoothing)
+        self._rebuild_step()
         
-        # Performance monitoring
-        self.last_motion_time = time.time()
+        # Performance monitoring: the hot path only bumps motion_count;
+        # rates are derived from a monotonic delta at each status tick
         self.motion_count = 0
         self.avg_latency = 0.0
+        self._last_status_ts = time.monotonic()
         
-        # Disable pyautogui failsafe for better performance
-        pyautogui.FAILSAFE = False
-        
+        # Pre-built parser for the binary motion frame
+        self._motion_struct = MOTION_STRUCT
+
+        # O(1) message dispatch on the first byte instead of a chain of
+        # startswith() checks; b'M' text frames are legacy motion data
+        self._dispatch = {
+            ord('M'): self._handle_motion_data,
+            ord('C'): self._handle_connect,
+            ord('D'): self._handle_disconnect,
+            ord('H'): self._handle_heartbeat,
+        }
+
+        # Batched smoothing: per-batch-size geometric EMA weight vectors
+        # (lazily built, invalidated when the smoothing factor changes)
+        self._ema_weights = {}
+
+        # Pending displacement, flushed to the OS at most once per
+        # MOVE_INTERVAL so redundant warp dispatches are skipped; a
+        # one-shot loop timer flushes the tail when the stream pauses
+        self._next_move_ts = 0.0
+        self._pending_dx = 0.0
+        self._pending_dy = 0.0
+        self._loop = None
+        self._flush_armed = False
+
+        # Each listener thread allocates its own recvmmsg buffer set
+        self._use_recvmmsg = _recvmmsg is not None
+
+        # Reusable receive buffer for the recvfrom fallback path; packets
+        # are parsed through a memoryview so nothing is copied per packet
+        self._rxbuf = bytearray(1500)
+        self._rxview = memoryview(self._rxbuf)
+
+        # Bind a direct OS cursor primitive and cache the screen size;
+        # pyautogui is only imported inside the backend as a last resort
+        self._backend = CursorBackend()
+        self._screen_w, self._screen_h = self._backend.screen_size()
+        # Precomputed clamp bounds for the move flush
+        self._sw1 = self._screen_w - 1
+        self._sh1 = self._screen_h - 1
+
         logger.info("Cursor Controller initialized")
-    
+
     def start(self):
         """Start the UDP server and cursor control"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.bind((self.host, self.port))
-            self.socket.settimeout(1.0)  # 1 second timeout for non-blocking operation
-            
+            if self.listeners > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+                logger.warning("SO_REUSEPORT not available, "
+                               "using a single listener")
+                self.listeners = 1
+
+            # With several listeners the kernel hashes flows across the
+            # sockets, removing the single receive-queue bottleneck
+            for _ in range(self.listeners):
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                if self.listeners > 1:
+                    sock.setsockopt(socket.SOL_SOCKET,
+                                    socket.SO_REUSEPORT, 1)
+                self._tune_socket(sock)
+                if (self.cpu_affinity is not None
+                        and sys.platform.startswith('linux')):
+                    try:
+                        sock.setsockopt(socket.SOL_SOCKET, SO_INCOMING_CPU,
+                                        self.cpu_affinity)
+                    except OSError as e:
+                        logger.debug(f"Could not set SO_INCOMING_CPU: {e}")
+                sock.bind((self.host, self.port))
+                sock.setblocking(False)
+                self.sockets.append(sock)
+            self.socket = self.sockets[0]
+
+            self._pin_cpu()
+
             self.is_running = True
-            logger.info(f"UDP server started on {self.host}:{self.port}")
-            
-            # Start listening thread
-            listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
-            listen_thread.start()
-            
-            # Start status monitoring thread
-            monitor_thread = threading.Thread(target=self._status_monitor, daemon=True)
-            monitor_thread.start()
-            
+
+            # Worker thread drains the frame queue so the event loop only
+            # ever blocks on the kernel, never on cursor dispatch
+            worker = threading.Thread(target=self._worker_loop, daemon=True)
+            worker.start()
+            logger.info(f"UDP server started on {self.host}:{self.port} "
+                        f"({self.listeners} listener(s))")
+
+            if HAVE_NUMBA:
+                # Warm up the JIT so the first real packet pays no compile cost
+                _motion_step(0.0, 0.0, np.zeros(2, dtype=np.float64),
+                             1.0, 0.5)
+
             logger.info("Cursor Controller started successfully")
             logger.info("Move your phone to control the cursor. Press Ctrl+C to stop.")
-            
-            # Keep main thread alive
+
+            # Single-threaded asyncio loop: packets are handled in the same
+            # task that read them (no GIL handoff) and the status tick is a
+            # call_later timer instead of a sleeping thread
+            if sys.platform.startswith('win'):
+                # The Proactor loop (Windows default since 3.8) has no
+                # add_reader; the selector loop supports everything we use
+                asyncio.set_event_loop_policy(
+                    asyncio.WindowsSelectorEventLoopPolicy())
             try:
-                while self.is_running:
-                    time.sleep(0.1)
+                asyncio.run(self._run())
             except KeyboardInterrupt:
                 logger.info("Shutdown requested by user")
-                
+
         except Exception as e:
             logger.error(f"Failed to start server: {e}")
             self.stop()
-    
+
+    async def _run(self):
+        """Serve all sockets and the periodic status log on the event loop"""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._stop_event = asyncio.Event()
+
+        # add_reader (rather than a DatagramProtocol endpoint) keeps the
+        # recvmmsg batch drain on the receive path
+        for sock in self.sockets:
+            rx = _RxBuffers() if self._use_recvmmsg else None
+            loop.add_reader(sock, self._on_readable, sock, rx)
+
+        status_handle = loop.call_later(STATUS_INTERVAL,
+                                        self._status_tick, loop)
+        try:
+            await self._stop_event.wait()
+        finally:
+            status_handle.cancel()
+            for sock in self.sockets:
+                loop.remove_reader(sock)
+
+    def _worker_loop(self):
+        """Drain queued frames: batched deltas get the vectorized smoothing
+        path, raw packets go through normal dispatch"""
+        q = self._q
+        ev = self._q_ev
+        while self.is_running:
+            if not ev.wait(timeout=1.0):
+                continue
+            ev.clear()
+            while q:
+                try:
+                    item = q.popleft()
+                except IndexError:
+                    break
+                if isinstance(item, np.ndarray):
+                    self._handle_motion_batch(item)
+                else:
+                    self._process_packet(*item)
+
+    def _on_readable(self, sock: socket.socket, rx: Optional['_RxBuffers']):
+        """Reader callback: drain one socket inside the event loop"""
+        try:
+            if rx is not None:
+                self._recv_batch(sock, rx)
+            else:
+                self._recv_single(sock)
+        except Exception as e:
+            if self.is_running:
+                logger.error("Error in listen loop: %s", e)
+
+    def _status_tick(self, loop):
+        """Periodic status timer; reschedules itself while running"""
+        self._log_status()
+        if self.is_running:
+            loop.call_later(STATUS_INTERVAL, self._status_tick, loop)
+
+
+    def _pin_cpu(self):
+        """Best-effort: pin the receive loop to one core, raise priority.
+
+        Keeping the kernel copy and the Python handler on the same core
+        avoids migration-induced cache misses; both steps need privileges
+        or a POSIX platform and are skipped quietly when unavailable.
+        """
+        if self.cpu_affinity is None:
+            return
+        try:
+            os.sched_setaffinity(0, {self.cpu_affinity})
+            logger.info(f"Receiver pinned to CPU {self.cpu_affinity}")
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Could not set CPU affinity: {e}")
+        try:
+            os.nice(-10)
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Could not raise process priority: {e}")
+
+    @staticmethod
+    def _tune_socket(sock: socket.socket):
+        """Apply best-effort latency and burst tuning to a listen socket"""
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                            SOCKET_RCVBUF)
+        except OSError as e:
+            logger.debug(f"Could not enlarge SO_RCVBUF: {e}")
+
+        if not sys.platform.startswith('linux'):
+            return
+        # These need Linux and, for some, elevated privileges; failures
+        # are harmless so only log at debug level
+        for level, opt, val, name in (
+                (socket.SOL_SOCKET, SO_BUSY_POLL, BUSY_POLL_USEC,
+                 'SO_BUSY_POLL'),
+                (socket.SOL_SOCKET, SO_PRIORITY, 6, 'SO_PRIORITY'),
+                (socket.IPPROTO_IP, IP_RECVERR, 0, 'IP_RECVERR')):
+            try:
+                sock.setsockopt(level, opt, val)
+            except OSError as e:
+                logger.debug(f"Could not set {name}: {e}")
+
     def stop(self):
         """Stop the server and cleanup"""
         self.is_running = False
-        if self.socket:
-            self.socket.close()
+        if self._stop_event is not None:
+            self._stop_event.set()
+        for sock in self.sockets:
+            sock.close()
+        self.sockets = []
         logger.info("Cursor Controller stopped")
+
+    def _recv_single(self, sock: socket.socket):
+        """Fallback single-datagram receive for non-recvmmsg platforms.
+
+        Receives into a reusable buffer; the frame is copied out when
+        queued because the buffer is overwritten by the next receive.
+        """
+        try:
+            nbytes, addr = sock.recvfrom_into(self._rxbuf)
+        except BlockingIOError:
+            return
+        if nbytes:
+            self._q.append((bytes(self._rxview[:nbytes]), addr))
+            self._q_ev.set()
+
+    def _recv_batch(self, sock: socket.socket, rx: '_RxBuffers'):
+        """Drain up to RECV_BATCH datagrams with a single recvmmsg() syscall"""
+        for i in range(RECV_BATCH):
+            rx.msgs[i].msg_hdr.msg_namelen = 128
+
+        count = _recvmmsg(sock.fileno(), rx.msgs,
+                          RECV_BATCH, MSG_WAITFORONE, None)
+        if count <= 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return
+            raise OSError(err, os.strerror(err))
+
+        # Split the batch: motion frames are collected into one delta
+        # array, everything else is queued as a raw packet. The reader
+        # only parses and enqueues; smoothing and cursor dispatch happen
+        # on the worker thread.
+        pairs = rx.pairs
+        k = 0
+        motion_ip = None
+        for i in range(count):
+            buf = rx.bufs[i]
+            nbytes = rx.msgs[i].msg_len
+            if nbytes == MOTION_FRAME_LEN and buf[0] == b'M':
+                pairs[k, 0], pairs[k, 1] = \
+                    self._motion_struct.unpack_from(buf, 1)
+                k += 1
+                if motion_ip is None:
+                    motion_ip = self._parse_sockaddr(rx.names[i].raw)[0]
+            else:
+                data = buf.raw[:nbytes]
+                addr = self._parse_sockaddr(rx.names[i].raw)
+                self._q.append((data, addr))
+
+        if k:
+            self._note_client(motion_ip)
+            # Copied because the recvmmsg buffers are reused next drain
+            self._q.append(pairs[:k].copy())
+        self._q_ev.set()
+
+    def _note_client(self, client_ip: str):
+        """Register a client IP, skipping the set update on repeats"""
+        if client_ip != self._last_client_ip:
+            self._last_client_ip = client_ip
+            self.connected_clients.add(client_ip)
+
+    @staticmethod
+    def _parse_sockaddr(raw: bytes) -> Tuple[str, int]:
+        """Decode a sockaddr_in filled in by recvmmsg into (ip, port)"""
+        port, packed_ip = struct.unpack_from('!2xH4s', raw)
+        return socket.inet_ntoa(packed_ip), port
     
-    def _listen_loop(self):
-        """Main listening loop for UDP packets"""
-        while self.is_running:
-            try:
-                data, addr = self.socket.recvfrom(1024)
-                if data:
-                    self._process_packet(data, addr)
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self.is_running:
-                    logger.error(f"Error in listen loop: {e}")
-    
-    def _process_packet(self, data: bytes, addr: Tuple[str, int]):
-        """Process incoming UDP packet"""
+    def _process_packet(self, data, addr: Tuple[str, int]):
+        """Process an incoming UDP packet (bytes or memoryview)"""
         try:
-            message = data.decode('utf-8').strip()
+            if not data:
+                return
             client_ip = addr[0]
-            
+
             # Update connected clients
-            self.connected_clients.add(client_ip)
-            
-            # Process different message types
-            if message.startswith('MOTION:'):
-                self._handle_motion_data(message, client_ip)
-            elif message.startswith('CONNECT:'):
-                logger.info(f"Client connected: {client_ip} - {message}")
-            elif message.startswith('DISCONNECT:'):
-                logger.info(f"Client disconnected: {client_ip} - {message}")
-                self.connected_clients.discard(client_ip)
-            elif message.startswith('HEARTBEAT:'):
-                # Heartbeat received, client is alive
-                pass
+            self._note_client(client_ip)
+
+            # Fast path: fixed-size binary motion frame, single byte compare
+            if len(data) == MOTION_FRAME_LEN and data[0] == MOTION_MARKER:
+                dx, dy = self._motion_struct.unpack_from(data, 1)
+                self._handle_motion(dx, dy, client_ip)
+                return
+
+            # One dict lookup on the first byte routes the message; only
+            # these rare non-motion packets materialize a bytes/str object
+            handler = self._dispatch.get(data[0])
+            if handler is not None:
+                try:
+                    message = bytes(data).decode('utf-8').strip()
+                except UnicodeDecodeError:
+                    # Goes through the token bucket like any other junk;
+                    # the blanket except below would log once per packet
+                    self._log_bad_packet("Undecodable packet from %s: %r",
+                                         client_ip, bytes(data))
+                    return
+                handler(message, client_ip)
             else:
-                logger.warning(f"Unknown message format from {client_ip}: {message}")
-                
+                self._log_bad_packet("Unknown message format from %s: %r",
+                                     client_ip, bytes(data))
+
         except Exception as e:
-            logger.error(f"Error processing packet from {addr}: {e}")
+            logger.error("Error processing packet from %s: %s", addr, e)
+
+    def _log_bad_packet(self, fmt: str, *args):
+        """Rate-limited warning for malformed packets; the message is only
+        formatted (lazily, by the logging framework) while budget remains"""
+        if self._bad_pkt_budget > 0:
+            self._bad_pkt_budget -= 1
+            logger.warning(fmt, *args)
+
+    def _handle_connect(self, message: str, client_ip: str):
+        """Handle a CONNECT announcement"""
+        logger.info(f"Client connected: {client_ip} - {message}")
+
+    def _handle_disconnect(self, message: str, client_ip: str):
+        """Handle a DISCONNECT announcement"""
+        logger.info(f"Client disconnected: {client_ip} - {message}")
+        self.connected_clients.discard(client_ip)
+        if client_ip == self._last_client_ip:
+            self._last_client_ip = None
+
+    def _handle_heartbeat(self, message: str, client_ip: str):
+        """Heartbeat received, client is alive"""
     
     def _handle_motion_data(self, message: str, client_ip: str):
-        """Handle motion data and update cursor position"""
+        """Parse a legacy text motion frame: "MOTION:dx,dy" """
         try:
-            # Parse motion data: "MOTION:dx,dy"
             motion_part = message.split(':', 1)[1]
             dx_str, dy_str = motion_part.split(',')
-            
-            dx = float(dx_str)
-            dy = float(dy_str)
-            
-            # Apply sensitivity
-            dx *= self.sensitivity
-            dy *= self.sensitivity
-            
-            # Apply smoothing
-            self.smoothed_dx = (self.smoothing_factor * self.smoothed_dx + 
-                              (1 - self.smoothing_factor) * dx)
-            self.smoothed_dy = (self.smoothing_factor * self.smoothed_dy + 
-                              (1 - self.smoothing_factor) * dy)
-            
-            # Move cursor
-            self._move_cursor(self.smoothed_dx, self.smoothed_dy)
-            
-            # Update performance metrics
-            current_time = time.time()
-            self.motion_count += 1
-            if self.motion_count > 1:
-                latency = current_time - self.last_motion_time
-                self.avg_latency = (self.avg_latency * 0.9 + latency * 0.1)
-            
-            self.last_motion_time = current_time
-            
-        except (ValueError, IndexError) as e:
-            logger.error(f"Invalid motion data format from {client_ip}: {message}")
+            self._handle_motion(float(dx_str), float(dy_str), client_ip)
+        except (ValueError, IndexError):
+            self._log_bad_packet("Invalid motion data format from %s: %s",
+                                 client_ip, message)
+
+    def _rebuild_step(self):
+        """Regenerate the fallback EMA step with the coefficients baked in.
+
+        Sensitivity and smoothing change rarely, so the scalar kernel is
+        specialized at set time: the floats become literals that CPython
+        constant-folds, leaving bytecode with no attribute lookups. Used
+        only when neither the Cython nor the Numba kernel is available.
+        """
+        beta = self.smoothing_factor
+        gain = (1.0 - beta) * self.sensitivity
+        source = ("def _step(dx, dy, s):\n"
+                  f"    s[0] = s[0] * {beta!r} + dx * {gain!r}\n"
+                  f"    s[1] = s[1] * {beta!r} + dy * {gain!r}\n"
+                  "    return s[0], s[1]\n")
+        namespace = {}
+        exec(source, namespace)
+        self._step = namespace['_step']
+
+    def _handle_motion(self, dx: float, dy: float, client_ip: str):
+        """Handle motion deltas and update cursor position"""
+        try:
+            with self._motion_lock:
+                # Sensitivity and smoothing are fused in one kernel call:
+                # Cython if built, else the Numba JIT, else the
+                # exec-specialized Python step
+                if self._hotpath is not None:
+                    sdx, sdy = self._hotpath.step(dx, dy)
+                elif HAVE_NUMBA:
+                    sdx, sdy = _motion_step(dx, dy, self._state,
+                                            self.sensitivity,
+                                            self.smoothing_factor)
+                else:
+                    sdx, sdy = self._step(dx, dy, self._state)
+                self._queue_move(sdx, sdy)
+                self.motion_count += 1
+
         except Exception as e:
-            logger.error(f"Error handling motion data: {e}")
+            logger.error("Error handling motion data: %s", e)
     
-    def _move_cursor(self, dx: float, dy: float):
-        """Move the cursor by the specified delta"""
+    def _handle_motion_batch(self, batch: np.ndarray):
+        """Update smoothing state from a (K, 2) batch of motion deltas.
+
+        With SciPy installed the exact IIR recurrence runs in C through
+        lfilter, with filter state carried across batches and the smoothed
+        deltas summed into one displacement. Otherwise the same result
+        comes from closed forms: geometric weight vectors update the state
+        and give the summed smoothed outputs as dot products, replacing K
+        Python loop iterations. Either way the K per-sample moves collapse
+        into a single cursor displacement -- within one batch only the
+        final position could ever be displayed anyway.
+        """
         try:
-            # Get current cursor position
-            current_x, current_y = pyautogui.position()
-            
-            # Calculate new position
-            new_x = int(current_x + dx)
-            new_y = int(current_y + dy)
-            
-            # Ensure cursor stays within screen bounds
-            screen_width, screen_height = pyautogui.size()
-            new_x = max(0, min(new_x, screen_width - 1))
-            new_y = max(0, min(new_y, screen_height - 1))
-            
-            # Move cursor
-            pyautogui.moveTo(new_x, new_y, duration=0)
-            
+            with self._motion_lock:
+                k = batch.shape[0]
+                beta = self.smoothing_factor
+
+                if HAVE_SCIPY:
+                    # _state is the one canonical EMA state (the scalar
+                    # paths update it too); the lfilter initial condition
+                    # is derived from it at entry: for this one-pole
+                    # section zi is just beta * y_prev
+                    zi = beta * self._state.reshape(1, 2)
+                    smoothed, _ = lfilter(
+                        [1.0 - beta], [1.0, -beta],
+                        batch * self.sensitivity, axis=0, zi=zi)
+                    self._state[:] = smoothed[-1]
+                    move_dx, move_dy = smoothed.sum(axis=0)
+                else:
+                    cached = self._ema_weights.get(k)
+                    if cached is None:
+                        # Closed forms of the EMA recurrence over a batch:
+                        # sample j feeds beta**(k-1-j)*(1-beta) into the
+                        # final state and 1 - beta**(k-j) into the summed
+                        # displacement, while the prior state carries
+                        # beta*(1-beta**k)/(1-beta) of displacement
+                        state_w = (np.power(beta, np.arange(k - 1, -1, -1))
+                                   * (1.0 - beta))
+                        disp_w = 1.0 - np.power(beta, np.arange(k, 0, -1))
+                        carry = (beta * (1.0 - beta ** k) / (1.0 - beta)
+                                 if beta < 1.0 else float(k))
+                        cached = (state_w, disp_w, carry)
+                        self._ema_weights[k] = cached
+                    state_w, disp_w, carry = cached
+                    scaled = batch * self.sensitivity
+                    move_dx, move_dy = (carry * self._state
+                                        + disp_w @ scaled)
+                    self._state *= beta ** k
+                    self._state += state_w @ scaled
+
+                self._queue_move(move_dx, move_dy)
+                self.motion_count += k
+
         except Exception as e:
-            logger.error(f"Error moving cursor: {e}")
+            logger.error("Error handling motion batch: %s", e)
+
+    def _queue_move(self, dx: float, dy: float):
+        """Accumulate displacement; warp at most once per display frame"""
+        self._pending_dx += dx
+        self._pending_dy += dy
+
+        now = time.monotonic()
+        if now < self._next_move_ts:
+            # Gated: arm a one-shot trailing flush so the tail of a
+            # gesture still lands if no further motion arrives
+            if not self._flush_armed and self._loop is not None:
+                self._flush_armed = True
+                self._loop.call_soon_threadsafe(
+                    self._loop.call_later, MOVE_INTERVAL,
+                    self._trailing_flush)
+            return
+        self._next_move_ts = now + MOVE_INTERVAL
+        self._flush_move()
+
+    def _trailing_flush(self):
+        """Loop timer: apply displacement stranded by the move gate"""
+        with self._motion_lock:
+            self._flush_armed = False
+            if self._pending_dx == 0.0 and self._pending_dy == 0.0:
+                return
+            now = time.monotonic()
+            if now < self._next_move_ts:
+                # A newer move re-opened the gate; fire again after it
+                self._flush_armed = True
+                self._loop.call_later(self._next_move_ts - now,
+                                      self._trailing_flush)
+                return
+            self._next_move_ts = now + MOVE_INTERVAL
+            self._flush_move()
+
+    def _flush_move(self):
+        """Apply the pending displacement to the OS cursor"""
+        cx, cy = self._backend.get_pos()
+        new_x = int(cx + self._pending_dx)
+        new_y = int(cy + self._pending_dy)
+        self._pending_dx = 0.0
+        self._pending_dy = 0.0
+
+        # Conditional expressions instead of the min()/max() builtins:
+        # no C function calls or argument tuples at 144 flushes/second
+        sw1 = self._sw1
+        sh1 = self._sh1
+        new_x = 0 if new_x < 0 else (sw1 if new_x > sw1 else new_x)
+        new_y = 0 if new_y < 0 else (sh1 if new_y > sh1 else new_y)
+        self._backend.set_pos(new_x, new_y)
     
-    def _status_monitor(self):
-        """Monitor and log system status"""
-        while self.is_running:
-            try:
-                time.sleep(5)  # Update every 5 seconds
-                
-                if self.connected_clients:
-                    # Log performance metrics
-                    fps = self.motion_count / 5.0 if self.motion_count > 0 else 0
-                    latency_ms = self.avg_latency * 1000
-                    
-                    logger.info(f"Status: {len(self.connected_clients)} client(s) connected, "
-                              f"FPS: {fps:.1f}, Latency: {latency_ms:.1f}ms")
-                    
-                    # Reset counters
-                    self.motion_count = 0
-                else:
-                    logger.info("Status: No clients connected")
-                    
-            except Exception as e:
-                logger.error(f"Error in status monitor: {e}")
+    def _log_status(self):
+        """Log system status; called from the event loop every tick"""
+        try:
+            now = time.monotonic()
+            elapsed = now - self._last_status_ts
+            self._last_status_ts = now
+            self._bad_pkt_budget = BAD_PACKET_LOG_BUDGET
+
+            if self.connected_clients:
+                # Derive rates from one clock read per tick; the hot path
+                # only increments motion_count
+                count = self.motion_count
+                self.motion_count = 0
+                fps = count / elapsed if elapsed > 0 else 0.0
+                self.avg_latency = elapsed / count if count else 0.0
+                latency_ms = self.avg_latency * 1000
+
+                logger.info(f"Status: {len(self.connected_clients)} client(s) connected, "
+                          f"FPS: {fps:.1f}, Latency: {latency_ms:.1f}ms")
+            else:
+                logger.info("Status: No clients connected")
+
+        except Exception as e:
+            logger.error(f"Error in status monitor: {e}")
     
     def set_sensitivity(self, sensitivity: float):
         """Set cursor sensitivity multiplier"""
         self.sensitivity = max(0.1, min(5.0, sensitivity))
+        if self._hotpath is not None:
+            self._hotpath.sensitivity = self.sensitivity
+        self._rebuild_step()
         logger.info(f"Sensitivity set to: {self.sensitivity}")
     
     def set_smoothing(self, smoothing: float):
         """Set motion smoothing factor (0.0 = no smoothing, 1.0 = maximum smoothing)"""
         self.smoothing_factor = max(0.0, min(1.0, smoothing))
+        if self._hotpath is not None:
+            self._hotpath.smoothing_factor = self.smoothing_factor
+        self._ema_weights.clear()
+        self._rebuild_step()
         logger.info(f"Smoothing factor set to: {self.smoothing_factor}")
     
     def get_status(self) -> dict:
@@ -233,11 +781,17 @@ def main():
     parser.add_argument('--port', type=int, default=5000, help='Port to listen on (default: 5000)')
     parser.add_argument('--sensitivity', type=float, default=1.0, help='Cursor sensitivity (default: 1.0)')
     parser.add_argument('--smoothing', type=float, default=0.7, help='Motion smoothing (0.0-1.0, default: 0.7)')
-    
+    parser.add_argument('--listeners', type=int, default=1,
+                        help='Number of SO_REUSEPORT listener sockets (default: 1)')
+    parser.add_argument('--cpu-core', type=int, default=None,
+                        help='Pin the receiver to this CPU core (default: no pinning)')
+
     args = parser.parse_args()
-    
+
     # Create and configure controller
-    controller = CursorController(host=args.host, port=args.port)
+    controller = CursorController(host=args.host, port=args.port,
+                                  listeners=args.listeners,
+                                  cpu_affinity=args.cpu_core)
     controller.set_sensitivity(args.sensitivity)
     controller.set_smoothing(args.smoothing)
     
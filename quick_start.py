@@ -30,7 +30,7 @@ def check_dependencies():
     """Check if required Python packages are installed"""
     print("\nChecking Python dependencies...")
     
-    required_packages = ['pyautogui', 'opencv-python', 'numpy', 'psutil']
+    required_packages = ['pyautogui', 'opencv-python', 'numpy']
     missing_packages = []
     
     for package in required_packages:
@@ -5,6 +5,14 @@ Setup script for Phone2PC Cursor Controller
 
 from setuptools import setup, find_packages
 
+# The hot packet-processing path has an optional Cython extension; pure
+# Python is used when Cython (or a compiler) is unavailable
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["pc_receiver/_hotpath.pyx"])
+except ImportError:
+    ext_modules = []
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -33,6 +41,7 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "phone2pc-cursor=pc_receiver.cursor_controller:main",